@@ -1,12 +1,12 @@
 # We need to have some module-private members in `Type`.
 # ruff: noqa: SLF001
 
-import re
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Mapping, Sequence
-from functools import cached_property
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from functools import lru_cache
+from sys import intern
 from types import EllipsisType
-from typing import Any
+from typing import Any, TypeGuard
 
 import eth_abi
 from eth_abi.exceptions import DecodingError
@@ -18,6 +18,17 @@ MAX_INTEGER_BITS = 256
 # Maximum size of a `bytes` type in Solidity.
 MAX_BYTES_SIZE = 32
 
+# The size of a single word in the ABI encoding.
+_WORD_SIZE = 32
+
+# The encodings of `bool` values are fixed, no need to build them every time
+# (`False` is just a zero word).
+_ZERO_WORD = b"\x00" * 32
+_TRUE_WORD = b"\x00" * 31 + b"\x01"
+
+# Zero paddings of every length up to a word, `_PADDINGS[n] == b"\x00" * n`.
+_PADDINGS = tuple(b"\x00" * length for length in range(_WORD_SIZE + 1))
+
 
 class ABIDecodingError(Exception):
     """Raised on an error when decoding a value in an Eth ABI encoded bytestring."""
@@ -33,6 +44,10 @@ or passed to ``eth_abi.encode()``.
 class Type(ABC):
     """The base type for Solidity types."""
 
+    __slots__ = ()
+
+    # Implementations intern the canonical forms, since the same handful of them is used
+    # everywhere, most notably as dictionary keys (in `eth_abi` and in method lookup).
     @property
     @abstractmethod
     def canonical_form(self) -> str:
@@ -102,158 +117,285 @@ class Type(ABC):
         # In Py3.10 they added EllipsisType which would work better here.
         # For now, relying on the documentation.
         if isinstance(array_size, int):
-            return Array(self, array_size)
+            return _make_array(self, array_size)
         if array_size == ...:
-            return Array(self, None)
+            return _make_array(self, None)
         raise TypeError(f"Invalid array size specifier type: {type(array_size).__name__}")
 
 
-class UInt(Type):
+class _WordType(Type):
+    """
+    The base for the static value types, whose values are always encoded as a single 32-byte word.
+    Such values can be encoded and decoded directly, without going through ``eth_abi``.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def _encode_word(self, val: Any) -> bytes:
+        """Checks the value and encodes it as a single 32-byte word."""
+        ...
+
+    @abstractmethod
+    def _decode_word(self, word: memoryview) -> Any | None:
+        """
+        Decodes a single 32-byte word.
+        Returns ``None`` if the word is not a valid encoding of a value of this type,
+        in which case the caller is expected to fall back to ``eth_abi``
+        to get a detailed error.
+        """
+        ...
+
+    # Values of the static value types are encoded into topics as is,
+    # which is exactly their single-word ABI encoding.
+
+    def encode_to_topic(self, val: Any) -> bytes:
+        return self._encode_word(val)
+
+    def _encode_to_topic_inner(self, val: Any) -> bytes:
+        return self._encode_word(val)
+
+    def decode_from_topic(self, val: bytes) -> Any | None:
+        if len(val) == _WORD_SIZE:
+            decoded = self._decode_word(memoryview(val))
+            if decoded is not None:
+                return decoded
+        # If the data is invalid, let `eth_abi` report the exact problem.
+        return super().decode_from_topic(val)
+
+
+class UInt(_WordType):
     """Corresponds to the Solidity ``uint<bits>`` type."""
 
+    __slots__ = ("_bits", "_canonical_form")
+
     def __init__(self, bits: int):
         if bits <= 0 or bits > MAX_INTEGER_BITS or bits % 8 != 0:
             raise ValueError(f"Incorrect `uint` bit size: {bits}")
         self._bits = bits
+        self._canonical_form = intern(f"uint{bits}")
 
     @property
     def canonical_form(self) -> str:
-        return f"uint{self._bits}"
+        return self._canonical_form
 
     def _check_val(self, val: Any) -> int:
+        # An exact `int` within the range is the common case, so it is checked first.
+        if type(val) is int:  # noqa: E721
+            # A single shift covers both bounds: it gives a nonzero result
+            # for negative numbers and for numbers that do not fit into the bit size.
+            if not val >> self._bits:
+                return val
         # `bool` is a subclass of `int`, but we would rather be more strict
         # and prevent possible bugs.
-        if not isinstance(val, int) or isinstance(val, bool):
+        elif not isinstance(val, int) or isinstance(val, bool):
             raise TypeError(
-                f"`{self.canonical_form}` must correspond to an integer, got {type(val).__name__}"
+                f"`{self._canonical_form}` must correspond to an integer, got {type(val).__name__}"
             )
         if val < 0:
             raise ValueError(
-                f"`{self.canonical_form}` must correspond to a non-negative integer, got {val}"
+                f"`{self._canonical_form}` must correspond to a non-negative integer, got {val}"
             )
-        if val >> self._bits != 0:
+        if val >> self._bits:
             raise ValueError(
-                f"`{self.canonical_form}` must correspond to an unsigned integer "
+                f"`{self._canonical_form}` must correspond to an unsigned integer "
                 f"under {self._bits} bits, got {val}"
             )
         return int(val)
 
-    def _normalize(self, val: Any) -> int:
-        return self._check_val(val)
+    # Both directions only need the check, so skip the extra call
+    # (these are invoked for every element of an array).
+    _normalize = _check_val
+    _denormalize = _check_val
 
-    def _denormalize(self, val: ABIType) -> int:
-        return self._check_val(val)
+    def _encode_word(self, val: Any) -> bytes:
+        return self._check_val(val).to_bytes(32, "big")
+
+    def _decode_word(self, word: memoryview) -> int | None:
+        val = int.from_bytes(word, "big")
+        return None if val >> self._bits else val
 
     def __eq__(self, other: object) -> bool:
         return isinstance(other, UInt) and self._bits == other._bits
 
+    def __hash__(self) -> int:
+        return hash((UInt, self._bits))
+
 
-class Int(Type):
+class Int(_WordType):
     """Corresponds to the Solidity ``int<bits>`` type."""
 
+    __slots__ = ("_bits", "_canonical_form", "_max", "_min")
+
     def __init__(self, bits: int):
         if bits <= 0 or bits > MAX_INTEGER_BITS or bits % 8 != 0:
             raise ValueError(f"Incorrect `int` bit size: {bits}")
         self._bits = bits
+        self._canonical_form = intern(f"int{bits}")
+        self._min = -(1 << (bits - 1))
+        self._max = 1 << (bits - 1)
 
     @property
     def canonical_form(self) -> str:
-        return f"int{self._bits}"
+        return self._canonical_form
 
     def _check_val(self, val: Any) -> int:
+        # An exact `int` within the range is the common case, so it is checked first.
+        if type(val) is int:  # noqa: E721
+            if self._min <= val < self._max:
+                return val
         # `bool` is a subclass of `int`, but we would rather be more strict
         # and prevent possible bugs.
-        if not isinstance(val, int) or isinstance(val, bool):
+        elif not isinstance(val, int) or isinstance(val, bool):
             raise TypeError(
-                f"`{self.canonical_form}` must correspond to an integer, got {type(val).__name__}"
+                f"`{self._canonical_form}` must correspond to an integer, got {type(val).__name__}"
             )
-        if (val + (1 << (self._bits - 1))) >> self._bits != 0:
+        if not self._min <= val < self._max:
             raise ValueError(
-                f"`{self.canonical_form}` must correspond to a signed integer "
+                f"`{self._canonical_form}` must correspond to a signed integer "
                 f"under {self._bits} bits, got {val}"
             )
         return int(val)
 
-    def _normalize(self, val: Any) -> int:
-        return self._check_val(val)
+    _normalize = _check_val
+    _denormalize = _check_val
 
-    def _denormalize(self, val: ABIType) -> int:
-        return self._check_val(val)
+    def _encode_word(self, val: Any) -> bytes:
+        return self._check_val(val).to_bytes(32, "big", signed=True)
+
+    def _decode_word(self, word: memoryview) -> int | None:
+        val = int.from_bytes(word, "big", signed=True)
+        return val if self._min <= val < self._max else None
 
     def __eq__(self, other: object) -> bool:
         return isinstance(other, Int) and self._bits == other._bits
 
+    def __hash__(self) -> int:
+        return hash((Int, self._bits))
+
 
 class Bytes(Type):
+    """Corresponds to the Solidity ``bytes`` type."""
+
+    __slots__ = ()
+
+    @property
+    def canonical_form(self) -> str:
+        return "bytes"
+
+    def _check_val(self, val: Any) -> bytes:
+        if not isinstance(val, bytes):
+            raise TypeError(f"`bytes` must correspond to a bytestring, got {type(val).__name__}")
+        return val
+
+    _normalize = _check_val
+    _denormalize = _check_val
+
+    def _encode_to_topic_outer(self, val: bytes) -> bytes:
+        # Dynamic `bytes` is a reference type and is therefore hashed.
+        return keccak(val)
+
+    def _encode_to_topic_inner(self, val: bytes) -> bytes:
+        # Dynamic `bytes` is padded to a multiple of 32 bytes.
+        padding_len = (32 - len(val)) % 32
+        return val + _PADDINGS[padding_len]
+
+    def decode_from_topic(self, _val: bytes) -> None:
+        # Cannot recover a hashed value.
+        return None
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Bytes)
+
+    def __hash__(self) -> int:
+        return hash(Bytes)
+
+
+class SizedBytes(_WordType):
     """Corresponds to the Solidity ``bytes<size>`` type."""
 
-    def __init__(self, size: None | int = None):
-        if size is not None and (size <= 0 or size > MAX_BYTES_SIZE):
+    __slots__ = ("_canonical_form", "_size")
+
+    def __init__(self, size: int):
+        if size <= 0 or size > MAX_BYTES_SIZE:
             raise ValueError(f"Incorrect `bytes` size: {size}")
         self._size = size
+        self._canonical_form = intern(f"bytes{size}")
 
     @property
     def canonical_form(self) -> str:
-        return f"bytes{self._size if self._size else ''}"
+        return self._canonical_form
 
     def _check_val(self, val: Any) -> bytes:
         if not isinstance(val, bytes):
             raise TypeError(
-                f"`{self.canonical_form}` must correspond to a bytestring, "
+                f"`{self._canonical_form}` must correspond to a bytestring, "
                 f"got {type(val).__name__}"
             )
-        if self._size is not None and len(val) != self._size:
+        if len(val) != self._size:
             raise ValueError(f"Expected {self._size} bytes, got {len(val)}")
         return val
 
-    def _normalize(self, val: Any) -> bytes:
-        return self._check_val(val)
+    _normalize = _check_val
+    _denormalize = _check_val
 
-    def _denormalize(self, val: ABIType) -> bytes:
-        return self._check_val(val)
+    def _encode_word(self, val: Any) -> bytes:
+        # Sized `bytes` are padded on the right.
+        return self._check_val(val).ljust(32, b"\x00")
 
-    def _encode_to_topic_outer(self, val: bytes) -> bytes:
-        if self._size is None:
-            # Dynamic `bytes` is a reference type and is therefore hashed.
-            return keccak(val)
-        # Sized `bytes` is a value type, falls back to the base implementation.
-        return super()._encode_to_topic_outer(val)
-
-    def _encode_to_topic_inner(self, val: bytes) -> bytes:
-        if self._size is None:
-            # Dynamic `bytes` is padded to a multiple of 32 bytes.
-            padding_len = (32 - len(val)) % 32
-            return val + b"\x00" * padding_len
-        # Sized `bytes` is a value type, falls back to the base implementation.
-        return super()._encode_to_topic_inner(val)
-
-    def decode_from_topic(self, val: bytes) -> None | bytes:
-        if self._size is None:
-            # Cannot recover a hashed value.
+    def _decode_word(self, word: memoryview) -> bytes | None:
+        # The padding must be all zeros
+        padding = word[self._size :]
+        if padding != _PADDINGS[len(padding)]:
             return None
-        return super().decode_from_topic(val)
+        return bytes(word[: self._size])
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, Bytes) and self._size == other._size
+        return isinstance(other, SizedBytes) and self._size == other._size
 
+    def __hash__(self) -> int:
+        return hash((SizedBytes, self._size))
 
-class AddressType(Type):
+
+_DYNAMIC_BYTES = Bytes()
+
+
+class AddressType(_WordType):
     """
     Corresponds to the Solidity ``address`` type.
     Not to be confused with :py:class:`ethereum_rpc.Address` which represents an address value.
     """
 
+    __slots__ = ()
+
     @property
     def canonical_form(self) -> str:
         return "address"
 
-    def _normalize(self, val: Any) -> str:
+    def _check_val(self, val: Any) -> Address:
         if not isinstance(val, Address):
             raise TypeError(
                 f"`address` must correspond to an `Address`-type value, "
                 f"got {type(val).__name__}"
             )
-        return val.checksum
+        return val
+
+    def _normalize(self, val: Any) -> str:
+        return self._check_val(val).checksum
+
+    def _encode_word(self, val: Any) -> bytes:
+        # Saves us the checksum calculation that `_normalize()` would perform.
+        return bytes(self._check_val(val)).rjust(32, b"\x00")
+
+    def _decode_word(self, word: memoryview) -> Address | None:
+        # The padding must be all zeros
+        if word[:12] != _PADDINGS[12]:
+            return None
+        return Address(bytes(word[12:]))
+
+    def _encode_to_topic_inner(self, val: str) -> bytes:
+        # Inner values are already normalized, that is, converted to checksummed strings.
+        return bytes.fromhex(val.removeprefix("0x")).rjust(32, b"\x00")
 
     def _denormalize(self, val: ABIType) -> Address:
         if not isinstance(val, str):
@@ -263,10 +405,15 @@ class AddressType(Type):
     def __eq__(self, other: object) -> bool:
         return isinstance(other, AddressType)
 
+    def __hash__(self) -> int:
+        return hash(AddressType)
+
 
 class String(Type):
     """Corresponds to the Solidity ``string`` type."""
 
+    __slots__ = ()
+
     @property
     def canonical_form(self) -> str:
         return "string"
@@ -278,19 +425,16 @@ class String(Type):
             )
         return val
 
-    def _normalize(self, val: Any) -> str:
-        return self._check_val(val)
-
-    def _denormalize(self, val: ABIType) -> str:
-        return self._check_val(val)
+    _normalize = _check_val
+    _denormalize = _check_val
 
     def _encode_to_topic_outer(self, val: str) -> bytes:
         # `string` is encoded and treated as dynamic `bytes`
-        return Bytes()._encode_to_topic_outer(val.encode())
+        return _DYNAMIC_BYTES._encode_to_topic_outer(val.encode())
 
     def _encode_to_topic_inner(self, val: str) -> bytes:
         # `string` is encoded and treated as dynamic `bytes`
-        return Bytes()._encode_to_topic_inner(val.encode())
+        return _DYNAMIC_BYTES._encode_to_topic_inner(val.encode())
 
     def decode_from_topic(self, _val: bytes) -> None:
         # Dynamic `string` is hashed, so the value cannot be recovered.
@@ -299,10 +443,15 @@ class String(Type):
     def __eq__(self, other: object) -> bool:
         return isinstance(other, String)
 
+    def __hash__(self) -> int:
+        return hash(String)
 
-class Bool(Type):
+
+class Bool(_WordType):
     """Corresponds to the Solidity ``bool`` type."""
 
+    __slots__ = ()
+
     @property
     def canonical_form(self) -> str:
         return "bool"
@@ -314,28 +463,42 @@ class Bool(Type):
             )
         return val
 
-    def _normalize(self, val: Any) -> bool:
-        return self._check_val(val)
+    _normalize = _check_val
+    _denormalize = _check_val
 
-    def _denormalize(self, val: ABIType) -> bool:
-        return self._check_val(val)
+    def _encode_word(self, val: Any) -> bytes:
+        return _TRUE_WORD if self._check_val(val) else _ZERO_WORD
+
+    def _decode_word(self, word: memoryview) -> bool | None:
+        if word == _TRUE_WORD:
+            return True
+        if word == _ZERO_WORD:
+            return False
+        return None
 
     def __eq__(self, other: object) -> bool:
         return isinstance(other, Bool)
 
+    def __hash__(self) -> int:
+        return hash(Bool)
+
 
 class Array(Type):
     """Corresponds to the Solidity array (``[<size>]``) type."""
 
+    __slots__ = ("_canonical_form", "_element_type", "_hash", "_size")
+
     def __init__(self, element_type: Type, size: None | int = None):
         self._element_type = element_type
         self._size = size
+        self._canonical_form = intern(
+            element_type.canonical_form + "[" + (str(size) if size else "") + "]"
+        )
+        self._hash = hash((Array, element_type, size))
 
-    @cached_property
+    @property
     def canonical_form(self) -> str:
-        return (
-            self._element_type.canonical_form + "[" + (str(self._size) if self._size else "") + "]"
-        )
+        return self._canonical_form
 
     def _check_val(self, val: Any) -> Sequence[Any]:
         if not isinstance(val, Sequence):
@@ -344,62 +507,86 @@ class Array(Type):
             raise ValueError(f"Expected {self._size} elements, got {len(val)}")
         return val
 
+    # The recursion only goes as deep as the nesting of the type itself
+    # (not the size of the value), so there is no need for an explicit stack.
+    # Just avoid looking up the element method anew for every item.
+
     def _normalize(self, val: Any) -> list[ABIType]:
-        return [self._element_type._normalize(item) for item in self._check_val(val)]
+        normalize = self._element_type._normalize
+        return [normalize(item) for item in self._check_val(val)]
 
     def _denormalize(self, val: ABIType) -> list[ABIType]:
-        return [self._element_type._denormalize(item) for item in self._check_val(val)]
+        denormalize = self._element_type._denormalize
+        return [denormalize(item) for item in self._check_val(val)]
 
     def _encode_to_topic_outer(self, val: Any) -> bytes:
         return keccak(self._encode_to_topic_inner(val))
 
     def _encode_to_topic_inner(self, val: Any) -> bytes:
-        return b"".join(self._element_type._encode_to_topic_inner(elem) for elem in val)
+        encode = self._element_type._encode_to_topic_inner
+        return b"".join([encode(elem) for elem in val])
 
     def decode_from_topic(self, _val: Any) -> None:
         return None
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         return (
             isinstance(other, Array)
+            # A cheap rejection before comparing the (possibly nested) element types
+            and self._hash == other._hash
             and self._element_type == other._element_type
             and self._size == other._size
         )
 
+    def __hash__(self) -> int:
+        return self._hash
+
 
 class Struct(Type):
     """Corresponds to the Solidity struct type."""
 
+    __slots__ = ("_canonical_form", "_field_names", "_fields", "_hash", "_items", "_str", "_types")
+
     def __init__(self, fields: Mapping[str, Type]):
-        self._fields = fields
+        self._fields = dict(fields)
+        # The field order is significant (it defines the encoding),
+        # so the ordered pairs double as the identity of the struct.
+        self._items = tuple(self._fields.items())
+        self._types = tuple(self._fields.values())
+        # For validating mappings; comparing a keys view with a set is cheaper than with a view.
+        self._field_names = frozenset(self._fields)
+        self._canonical_form = intern("(" + ",".join(tp.canonical_form for tp in self._types) + ")")
+        self._str = "(" + ", ".join(str(tp) + " " + str(name) for name, tp in self._items) + ")"
+        self._hash = hash((Struct, self._items))
 
-    @cached_property
+    @property
     def canonical_form(self) -> str:
-        return "(" + ",".join(field.canonical_form for field in self._fields.values()) + ")"
+        return self._canonical_form
 
     def _check_val(self, val: Any) -> Sequence[Any]:
         if not isinstance(val, Sequence):
             raise TypeError(f"Expected an iterable, got {type(val).__name__}")
-        if len(val) != len(self._fields):
-            raise ValueError(f"Expected {len(self._fields)} elements, got {len(val)}")
+        if len(val) != len(self._types):
+            raise ValueError(f"Expected {len(self._types)} elements, got {len(val)}")
         return val
 
     def _normalize(self, val: Any) -> list[ABIType]:
         if isinstance(val, Mapping):
-            if val.keys() != self._fields.keys():
+            if val.keys() != self._field_names:
                 raise ValueError(
                     f"Expected fields {list(self._fields.keys())}, got {list(val.keys())}"
                 )
-            return [tp._normalize(val[name]) for name, tp in self._fields.items()]
+            return [tp._normalize(val[name]) for name, tp in self._items]
         return [
-            tp._normalize(item)
-            for item, tp in zip(self._check_val(val), self._fields.values(), strict=True)
+            tp._normalize(item) for item, tp in zip(self._check_val(val), self._types, strict=True)
         ]
 
     def _denormalize(self, val: ABIType) -> dict[str, ABIType]:
         return {
             name: tp._denormalize(item)
-            for item, (name, tp) in zip(self._check_val(val), self._fields.items(), strict=True)
+            for item, (name, tp) in zip(self._check_val(val), self._items, strict=True)
         }
 
     def _encode_to_topic_outer(self, val: Any) -> bytes:
@@ -407,8 +594,7 @@ class Struct(Type):
 
     def _encode_to_topic_inner(self, val: Any) -> bytes:
         return b"".join(
-            tp._encode_to_topic_inner(elem)
-            for elem, tp in zip(val, self._fields.values(), strict=True)
+            [tp._encode_to_topic_inner(elem) for elem, tp in zip(val, self._types, strict=True)]
         )
 
     def decode_from_topic(self, _val: Any) -> None:
@@ -416,20 +602,25 @@ class Struct(Type):
 
     def __str__(self) -> str:
         # Overriding  the `Type`'s implementation because we want to show the field names too
-        return "(" + ", ".join(str(tp) + " " + str(name) for name, tp in self._fields.items()) + ")"
+        return self._str
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        # structs with the same fields but in different order are not equal
         return (
-            isinstance(other, Struct)
-            and self._fields == other._fields
-            # structs with the same fields but in different order are not equal
-            and list(self._fields) == list(other._fields)
+            isinstance(other, Struct) and self._hash == other._hash and self._items == other._items
         )
 
+    def __hash__(self) -> int:
+        return self._hash
+
+
+# Types are immutable and hashable, so the arrays of them can be shared.
+@lru_cache(maxsize=1024)
+def _make_array(element_type: Type, size: None | int) -> Array:
+    return Array(element_type, size)
 
-_UINT_RE = re.compile(r"uint(\d+)")
-_INT_RE = re.compile(r"int(\d+)")
-_BYTES_RE = re.compile(r"bytes(\d+)?")
 
 _NO_PARAMS = {
     "address": AddressType(),
@@ -437,75 +628,158 @@ _NO_PARAMS = {
     "bool": Bool(),
 }
 
+_SIZED_TYPES: tuple[tuple[str, Callable[[int], Type]], ...] = (
+    ("uint", UInt),
+    ("int", Int),
+    ("bytes", SizedBytes),
+)
+
+
+def _parse_size(size_str: str) -> None | int:
+    # `str.isdecimal()` accepts non-ASCII digits too, which `int()` would happily parse.
+    if size_str.isascii() and size_str.isdecimal():
+        return int(size_str)
+    return None
+
 
+# Real ABIs repeat the same handful of type strings over and over,
+# and the returned types are immutable, so they can be shared.
+@lru_cache(maxsize=1024)
 def type_from_abi_string(abi_string: str) -> Type:
-    if match := _UINT_RE.match(abi_string):
-        return UInt(int(match.group(1)))
-    if match := _INT_RE.match(abi_string):
-        return Int(int(match.group(1)))
-    if match := _BYTES_RE.match(abi_string):
-        size = match.group(1)
-        return Bytes(int(size) if size else None)
     if abi_string in _NO_PARAMS:
         return _NO_PARAMS[abi_string]
+    if abi_string == "bytes":
+        return Bytes()
+    for prefix, sized_type in _SIZED_TYPES:
+        if abi_string.startswith(prefix):
+            size = _parse_size(abi_string[len(prefix) :])
+            if size is not None:
+                return sized_type(size)
     raise ValueError(f"Unknown type: {abi_string}")
 
 
-def dispatch_type(abi_entry: Mapping[str, Any]) -> Type:
-    type_str = abi_entry["type"]
-    match = re.match(r"^([\w\d\[\]]*?)(\[(\d+)?\])?$", type_str)
-    if not match:
+# Same as for `type_from_abi_string()`, the type strings repeat a lot.
+@lru_cache(maxsize=1024)
+def _split_array_suffixes(type_str: str) -> tuple[str, tuple[None | int, ...]]:
+    """
+    Splits a type string like ``uint8[2][]`` into the element type name
+    and the array sizes, innermost first.
+    """
+    element_type_name = type_str
+    array_sizes: list[None | int] = []
+    while element_type_name.endswith("]"):
+        suffix_start = element_type_name.rfind("[")
+        if suffix_start == -1:
+            raise ValueError(f"Incorrect type format: {type_str}")
+        size_str = element_type_name[suffix_start + 1 : -1]
+        if size_str:
+            size = _parse_size(size_str)
+            if size is None:
+                raise ValueError(f"Incorrect type format: {type_str}")
+        else:
+            size = None
+        array_sizes.append(size)
+        element_type_name = element_type_name[:suffix_start]
+
+    if not element_type_name.isidentifier():
         raise ValueError(f"Incorrect type format: {type_str}")
 
-    element_type_name = match.group(1)
-    is_array = match.group(2)
-    array_size = match.group(3)
-    if array_size is not None:
-        array_size = int(array_size)
+    return element_type_name, tuple(reversed(array_sizes))
 
-    if is_array:
-        element_entry = dict(abi_entry)
-        element_entry["type"] = element_type_name
-        element_type = dispatch_type(element_entry)
-        return Array(element_type, array_size)
 
+def dispatch_type(abi_entry: Mapping[str, Any]) -> Type:
+    element_type_name, array_sizes = _split_array_suffixes(abi_entry["type"])
+
+    element_type: Type
     if element_type_name == "tuple":
         fields = {}
         for component in abi_entry["components"]:
             fields[component["name"]] = dispatch_type(component)
-        return Struct(fields)
+        element_type = Struct(fields)
+    else:
+        element_type = type_from_abi_string(element_type_name)
 
-    return type_from_abi_string(element_type_name)
+    for array_size in array_sizes:
+        element_type = Array(element_type, array_size)
+    return element_type
 
 
 def dispatch_types(abi_entry: Iterable[dict[str, Any]]) -> list[Type] | dict[str, Type]:
-    names = [entry["name"] for entry in abi_entry]
+    named: dict[str, Type] = {}
+    unnamed: list[Type] = []
+    has_duplicates = False
+    for entry in abi_entry:
+        name = entry["name"]
+        tp = dispatch_type(entry)
+        if not name:
+            unnamed.append(tp)
+        elif name in named:
+            has_duplicates = True
+        else:
+            named[name] = tp
+
+    if named and unnamed:
+        raise ValueError("Arguments must be either all named or all unnamed")
 
     # Unnamed arguments; treat as positional arguments
-    if names and all(not name for name in names):
-        return [dispatch_type(entry) for entry in abi_entry]
-
-    if any(not name for name in names):
-        raise ValueError("Arguments must be either all named or all unnamed")
+    if unnamed:
+        return unnamed
 
     # Since we are returning a dictionary, need to be sure we don't silently merge entries
-    if len(names) != len(set(names)):
+    if has_duplicates:
         raise ValueError("All ABI entries must have distinct names")
-    return {entry["name"]: dispatch_type(entry) for entry in abi_entry}
+    return named
+
+
+def _are_words(types: Sequence[Type]) -> TypeGuard[Sequence[_WordType]]:
+    return all(isinstance(tp, _WordType) for tp in types)
 
 
 def encode_args(*types_and_args: tuple[Type, Any]) -> bytes:
+    types: Sequence[Type]
     if types_and_args:
         types, args = zip(*types_and_args, strict=True)
     else:
         types, args = (), ()
+
+    if _are_words(types):
+        # All the values are static and take exactly one word each,
+        # so the encoding is just their concatenation, without any offsets or tails.
+        return b"".join(tp._encode_word(arg) for tp, arg in zip(types, args, strict=True))
+
     return eth_abi.encode(
         [tp.canonical_form for tp in types],
         tuple(tp._normalize(arg) for tp, arg in zip(types, args, strict=True)),
     )
 
 
+def _decode_words(types: Sequence[_WordType], data: bytes) -> tuple[Any, ...] | None:
+    """
+    Decodes a sequence of static value types, each taking exactly one 32-byte word.
+    Returns ``None`` if any of the words is not a valid encoding of the corresponding type.
+    """
+    if len(data) < _WORD_SIZE * len(types):
+        return None
+    # Slicing a memoryview does not copy the data.
+    words = memoryview(data)
+    values = []
+    for i, tp in enumerate(types):
+        value = tp._decode_word(words[i * _WORD_SIZE : (i + 1) * _WORD_SIZE])
+        if value is None:
+            return None
+        values.append(value)
+    return tuple(values)
+
+
 def decode_args(types: Iterable[Type], data: bytes) -> tuple[ABIType, ...]:
+    types = list(types)
+
+    if _are_words(types):
+        values = _decode_words(types, data)
+        if values is not None:
+            return values
+        # If the data is invalid, let `eth_abi` report the exact problem.
+
     canonical_types = [tp.canonical_form for tp in types]
     try:
         values = eth_abi.decode(canonical_types, data)
@@ -65,21 +65,29 @@ class LogFilter:
     provider_path: tuple[int, ...]
 
 
+@dataclass
+class CachedValues:
+    """Values that do not change for a given provider and can be fetched only once."""
+
+    net_version: None | str = None
+    chain_id: None | int = None
+
+
 class Client:
     """An Ethereum RPC client."""
 
     def __init__(self, provider: Provider):
         self._provider = provider
-        self._net_version: None | str = None
-        self._chain_id: None | int = None
+        self._cached_values = CachedValues()
 
     @asynccontextmanager
     async def session(self) -> AsyncIterator["ClientSession"]:
         """Opens a session to the client allowing the backend to optimize sequential requests."""
         async with self._provider.session() as provider_session:
-            client_session = ClientSession(provider_session)
+            # The cached values are shared with the sessions,
+            # so whatever one session fetches is available to all the subsequent ones.
+            client_session = ClientSession(provider_session, self._cached_values)
             yield client_session
-            # TODO (#58): incorporate cached values from the session back into the client
 
 
 class RemoteError(Exception):
@@ -160,6 +168,28 @@ async def rpc_call(
         return structure(ret_type, result)
 
 
+async def rpc_call_batch(
+    provider_session: ProviderSession,
+    method_name: str,
+    ret_type: type[RetType],
+    args_list: Iterable[Sequence[Any]],
+) -> list[RetType]:
+    """
+    Calls the same method with each of the given argument lists in a single batch.
+    Catches various response formatting errors and returns them in a unified way;
+    if any of the calls failed, raises the error for the first of them.
+    """
+    requests = [(method_name, [unstructure(arg) for arg in args]) for args in args_list]
+    with convert_errors(method_name):
+        results = await provider_session.rpc_batch(requests)
+        structured = []
+        for result in results:
+            if isinstance(result, RPCError):
+                raise result
+            structured.append(structure(ret_type, result))
+        return structured
+
+
 async def rpc_call_pin(
     provider_session: ProviderSession, method_name: str, ret_type: type[RetType], *args: Any
 ) -> tuple[RetType, tuple[int, ...]]:
@@ -303,26 +333,107 @@ def decode_contract_error(
 class ClientSession:
     """An open session to the provider."""
 
-    def __init__(self, provider_session: ProviderSession):
+    def __init__(
+        self, provider_session: ProviderSession, cached_values: None | CachedValues = None
+    ):
         self._provider_session = provider_session
-        self._net_version: None | str = None
-        self._chain_id: None | int = None
+        self._cached_values = cached_values or CachedValues()
+        self._read_cache: None | dict[tuple[Any, ...], Any] = None
+        # Incremented every time the cache is invalidated,
+        # so that the results of calls started before that are not stored.
+        self._read_cache_generation = 0
+        self._last_seen_block_number: None | int = None
+
+    @contextmanager
+    def read_cache(self) -> Iterator[None]:
+        """
+        Within this context the results of read-only calls
+        (``eth_getBalance``, ``eth_getTransactionCount``, ``eth_getCode``, ``eth_getStorageAt``,
+        ``eth_gasPrice``, ``eth_call``) with the same arguments are cached.
+        The cache is cleared whenever a transaction is sent or its receipt is received
+        via this session, or when :py:meth:`eth_block_number` returns a new block number.
+
+        .. warning::
+
+           Other than that, the cached results are not refreshed.
+           Reads at ``latest`` or ``pending`` blocks and ``eth_gasPrice`` will return
+           stale values if the chain advances (e.g. because of transactions sent by other parties)
+           while the context is active.
+           Use explicit block numbers, or keep the context short, if that matters.
+        """
+        if self._read_cache is not None:
+            yield
+            return
+
+        self._read_cache = {}
+        try:
+            yield
+        finally:
+            self._read_cache = None
+
+    def _clear_read_cache(self) -> None:
+        self._read_cache_generation += 1
+        if self._read_cache is not None:
+            self._read_cache.clear()
+
+    async def _cached_rpc_call(
+        self, cache_key: tuple[Any, ...], method_name: str, ret_type: type[RetType], *args: Any
+    ) -> RetType:
+        cache = self._read_cache
+        if cache is None:
+            return await rpc_call(self._provider_session, method_name, ret_type, *args)
+        if cache_key in cache:
+            return cast(RetType, cache[cache_key])
+
+        generation = self._read_cache_generation
+        result = await rpc_call(self._provider_session, method_name, ret_type, *args)
+        # Another task could have left the cache context or invalidated the cache
+        # while the call was in flight, in which case the result may be stale.
+        if self._read_cache is cache and self._read_cache_generation == generation:
+            cache[cache_key] = result
+        return result
 
     async def net_version(self) -> str:
-        """Calls the ``net_version`` RPC method."""
-        if self._net_version is None:
-            self._net_version = await rpc_call(self._provider_session, "net_version", str)
-        return self._net_version
+        """
+        Calls the ``net_version`` RPC method.
+        The result is cached, so the RPC call is only made once per :py:class:`Client`.
+        """
+        if self._cached_values.net_version is None:
+            self._cached_values.net_version = await rpc_call(
+                self._provider_session, "net_version", str
+            )
+        return self._cached_values.net_version
 
     async def eth_chain_id(self) -> int:
-        """Calls the ``eth_chainId`` RPC method."""
-        if self._chain_id is None:
-            self._chain_id = await rpc_call(self._provider_session, "eth_chainId", int)
-        return self._chain_id
+        """
+        Calls the ``eth_chainId`` RPC method.
+        The result is cached, so the RPC call is only made once per :py:class:`Client`.
+        """
+        if self._cached_values.chain_id is None:
+            self._cached_values.chain_id = await rpc_call(
+                self._provider_session, "eth_chainId", int
+            )
+        return self._cached_values.chain_id
 
     async def eth_get_balance(self, address: Address, block: Block = BlockLabel.LATEST) -> Amount:
         """Calls the ``eth_getBalance`` RPC method."""
-        return await rpc_call(self._provider_session, "eth_getBalance", Amount, address, block)
+        return await self._cached_rpc_call(
+            ("eth_getBalance", address, block), "eth_getBalance", Amount, address, block
+        )
+
+    async def eth_get_balance_batch(
+        self, addresses: Iterable[Address], block: Block = BlockLabel.LATEST
+    ) -> list[Amount]:
+        """
+        Calls the ``eth_getBalance`` RPC method for each of ``addresses`` in a single batch request
+        (if the provider supports it, otherwise one by one).
+        """
+        return await rpc_call_batch(
+            self._provider_session,
+            "eth_getBalance",
+            Amount,
+            [(address, block) for address in addresses],
+        )
 
     async def eth_get_transaction_by_hash(self, tx_hash: TxHash) -> None | TxInfo:
         """Calls the ``eth_getTransactionByHash`` RPC method."""
@@ -356,8 +467,8 @@ class ClientSession:
         self, address: Address, block: Block = BlockLabel.LATEST
     ) -> int:
         """Calls the ``eth_getTransactionCount`` RPC method."""
-        return await rpc_call(
-            self._provider_session,
+        return await self._cached_rpc_call(
+            ("eth_getTransactionCount", address, block),
             "eth_getTransactionCount",
             int,
             address,
@@ -366,14 +477,16 @@ class ClientSession:
 
     async def eth_get_code(self, address: Address, block: Block = BlockLabel.LATEST) -> bytes:
         """Calls the ``eth_getCode`` RPC method."""
-        return await rpc_call(self._provider_session, "eth_getCode", bytes, address, block)
+        return await self._cached_rpc_call(
+            ("eth_getCode", address, block), "eth_getCode", bytes, address, block
+        )
 
     async def eth_get_storage_at(
         self, address: Address, position: int, block: Block = BlockLabel.LATEST
     ) -> bytes:
         """Calls the ``eth_getCode`` RPC method."""
-        return await rpc_call(
-            self._provider_session,
+        return await self._cached_rpc_call(
+            ("eth_getStorageAt", address, position, block),
             "eth_getStorageAt",
             bytes,
             address,
@@ -382,14 +495,27 @@ class ClientSession:
         )
 
     async def wait_for_transaction_receipt(
-        self, tx_hash: TxHash, poll_latency: float = 1.0
+        self,
+        tx_hash: TxHash,
+        poll_latency: float = 1.0,
+        max_poll_latency: float = 5.0,
+        backoff: float = 1.5,
     ) -> TxReceipt:
-        """Queries the transaction receipt waiting for ``poll_latency`` between each attempt."""
+        """
+        Queries the transaction receipt waiting for ``poll_latency`` after the first attempt.
+        The waiting time is multiplied by ``backoff`` after each subsequent attempt,
+        up to ``max_poll_latency`` (or ``poll_latency``, if it is greater).
+        """
+        # An explicitly requested long polling interval must not be shortened by the default cap
+        max_poll_latency = max(max_poll_latency, poll_latency)
         while True:
             receipt = await self.eth_get_transaction_receipt(tx_hash)
             if receipt is not None:
+                # The transaction has been mined, so the state has changed
+                self._clear_read_cache()
                 return receipt
             await anyio.sleep(poll_latency)
+            poll_latency = min(poll_latency * backoff, max_poll_latency)
 
     async def eth_call(
         self,
@@ -406,8 +532,8 @@ class ClientSession:
         """
         params = EthCallParams(to=call.contract_address, data=call.data_bytes, from_=sender_address)
 
-        encoded_output = await rpc_call(
-            self._provider_session,
+        encoded_output = await self._cached_rpc_call(
+            ("eth_call", call.contract_address, call.data_bytes, sender_address, block),
             "eth_call",
             bytes,
             params,
@@ -415,9 +541,44 @@ class ClientSession:
         )
         return call.decode_output(encoded_output)
 
+    async def eth_call_batch(
+        self,
+        calls: Iterable[BoundMethodCall],
+        block: Block = BlockLabel.LATEST,
+        sender_address: None | Address = None,
+    ) -> list[Any]:
+        """
+        Sends several prepared contract method calls in a single batch request
+        (if the provider supports it, otherwise one by one).
+        Returns the list of decoded outputs in the same order as ``calls``.
+
+        If any of the calls fails, the error for the first failed one is raised.
+        """
+        calls = list(calls)
+        encoded_outputs = await rpc_call_batch(
+            self._provider_session,
+            "eth_call",
+            bytes,
+            [
+                (
+                    EthCallParams(
+                        to=call.contract_address, data=call.data_bytes, from_=sender_address
+                    ),
+                    block,
+                )
+                for call in calls
+            ],
+        )
+        return [
+            call.decode_output(encoded_output)
+            for call, encoded_output in zip(calls, encoded_outputs, strict=True)
+        ]
+
     async def _eth_send_raw_transaction(self, tx_bytes: bytes) -> TxHash:
         """Sends a signed and serialized transaction."""
-        return await rpc_call(self._provider_session, "eth_sendRawTransaction", TxHash, tx_bytes)
+        tx_hash = await rpc_call(self._provider_session, "eth_sendRawTransaction", TxHash, tx_bytes)
+        self._clear_read_cache()
+        return tx_hash
 
     async def _estimate_gas(self, params: EstimateGasParams, block: Block) -> int:
         return await rpc_call(self._provider_session, "eth_estimateGas", int, params, block)
@@ -492,11 +653,16 @@ class ClientSession:
 
     async def eth_gas_price(self) -> Amount:
         """Calls the ``eth_gasPrice`` RPC method."""
-        return await rpc_call(self._provider_session, "eth_gasPrice", Amount)
+        return await self._cached_rpc_call(("eth_gasPrice",), "eth_gasPrice", Amount)
 
     async def eth_block_number(self) -> int:
         """Calls the ``eth_blockNumber`` RPC method."""
-        return await rpc_call(self._provider_session, "eth_blockNumber", int)
+        block_number = await rpc_call(self._provider_session, "eth_blockNumber", int)
+        # A new block may have changed the state, so the cached reads can be stale.
+        if block_number != self._last_seen_block_number:
+            self._last_seen_block_number = block_number
+            self._clear_read_cache()
+        return block_number
 
     async def eth_get_block_by_hash(
         self, block_hash: BlockHash, *, with_transactions: bool = False
@@ -574,12 +740,12 @@ class ClientSession:
         destination_address: Address,
         amount: Amount,
         gas: None | int = None,
-    ) -> None:
+    ) -> TxReceipt:
         """
         Transfers funds from the address of the attached signer to the destination address.
         If ``gas`` is ``None``, the required amount of gas is estimated first,
         otherwise the provided value is used.
-        Waits for the transaction to be confirmed.
+        Waits for the transaction to be confirmed and returns its receipt.
 
         Raises :py:class:`TransactionFailed` if the transaction was submitted successfully,
         but could not be processed.
@@ -588,6 +754,7 @@ class ClientSession:
         receipt = await self.wait_for_transaction_receipt(tx_hash)
         if not receipt.succeeded:
             raise TransactionFailed(f"Transfer failed (receipt: {receipt})")
+        return receipt
 
     async def deploy(
         self,
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator, Iterable
+from collections.abc import AsyncIterator, Iterable, Sequence
 from contextlib import AsyncExitStack, asynccontextmanager
 
 from ethereum_rpc import RPCError
@@ -127,6 +127,29 @@ class FallbackProvider(Provider):
             )
 
 
+def _most_informative_error(exceptions: list[Exception]) -> Exception:
+    # Here we may have a list with each element being
+    # `RPCError`, `ProtocolError`, `InvalidResponse`, or `Unreachable`.
+    # Since the users of `Provider` rely on the error being one of these types,
+    # we can only raise one. So we pick the one with the most information.
+    #
+    # RPC errors give the most information, since they usually signify our request was invalid,
+    # so all the providers would respond to it in the same manner.
+    #
+    # `InvalidResponse` means that the library is unable to parse the response for some reason,
+    # probably because of a bug. So it will be the same for all providers.
+    #
+    # The other two, `ProtocolError` and `Unreachable` is exactly why we have the fallback.
+    # It is pretty much expected to happen.
+    rpc_errors = [exc for exc in exceptions if isinstance(exc, RPCError)]
+    if len(rpc_errors) > 0:
+        return rpc_errors[0]
+    invalid_responses = [exc for exc in exceptions if isinstance(exc, InvalidResponse)]
+    if len(invalid_responses) > 0:
+        return invalid_responses[0]
+    return exceptions[0]
+
+
 class FallbackProviderSession(ProviderSession):
     def __init__(
         self, sessions: list[ProviderSession], strategy: FallbackStrategy, *, same_provider: bool
@@ -148,31 +171,27 @@ class FallbackProviderSession(ProviderSession):
             else:
                 return result, (provider_idx, *sub_idx)
 
-        # Here we may have a list with each element being
-        # `RPCError`, `ProtocolError`, `InvalidResponse`, or `Unreachable`.
-        # Since the users of `Provider` rely on the error being one of these types,
-        # we can only raise one. So we raise the one with the most information.
-        #
-        # RPC errors give the most information, since they usually signify our request was invalid,
-        # so all the providers would respond to it in the same manner.
-        #
-        # `InvalidResponse` means that the library is unable to parse the response for some reason,
-        # probably because of a bug. So it will be the same for all providers.
-        #
-        # The other two, `ProtocolError` and `Unreachable` is exactly why we have the fallback.
-        # It is pretty much expected to happen.
-        rpc_errors = [exc for exc in exceptions if isinstance(exc, RPCError)]
-        if len(rpc_errors) > 0:
-            raise rpc_errors[0]
-        invalid_responses = [exc for exc in exceptions if isinstance(exc, InvalidResponse)]
-        if len(invalid_responses) > 0:
-            raise invalid_responses[0]
-        raise exceptions[0]
+        raise _most_informative_error(exceptions)
 
     async def rpc(self, method: str, *args: JSON) -> JSON:
         result, _provider = await self.rpc_and_pin(method, *args)
         return result
 
+    async def rpc_batch(self, calls: Sequence[tuple[str, Sequence[JSON]]]) -> list[JSON | RPCError]:
+        # The whole batch is sent to a single provider, so that it still takes one round-trip.
+        # Errors of individual calls are a part of the result and do not trigger the fallback.
+        exceptions: list[Exception] = []
+        provider_idxs = self._strategy.get_provider_order()
+        for provider_idx in provider_idxs:
+            try:
+                return await self._sessions[provider_idx].rpc_batch(calls)
+            # PERF203: There won't be a lot of providers, and we need to collect errors from each.
+            # BLE001: it's just a middleware, collecting all errors.
+            except Exception as exc:  # noqa: PERF203, BLE001
+                exceptions.append(exc)
+
+        raise _most_informative_error(exceptions)
+
     async def rpc_at_pin(self, path: tuple[int, ...], method: str, *args: JSON) -> JSON:
         if self._same_provider:
             return await self.rpc(method, *args)
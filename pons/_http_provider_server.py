@@ -27,38 +27,57 @@ def parse_request(request: JSON) -> tuple[JSON, str, list[JSON]]:
     return (request_id, method, params)
 
 
-async def process_request_inner(provider: Provider, request: JSON) -> tuple[JSON, JSON]:
-    try:
-        request_id, method, params = parse_request(request)
-    except (KeyError, TypeError) as exc:
-        raise RPCError.with_code(
-            RPCErrorCode.INVALID_REQUEST, "Cannot parse the request as JSON"
-        ) from exc
-
-    async with provider.session() as session:
-        result = await session.rpc(method, *params)
-
-    return request_id, result
-
-
 async def process_request(provider: Provider, request: JSON) -> tuple[HTTPStatus, JSON]:
     """
     Partially parses the incoming JSON RPC request, passes it to the VM wrapper,
     and wraps the results in a JSON RPC formatted response.
     """
     try:
-        request_id, result = await process_request_inner(provider, request)
+        request_id, method, params = parse_request(request)
+    except (KeyError, TypeError):
+        error = RPCError.with_code(RPCErrorCode.INVALID_REQUEST, "Cannot parse the request as JSON")
+        return HTTPStatus.BAD_REQUEST, {"jsonrpc": "2.0", "id": None, "error": unstructure(error)}
+
+    try:
+        async with provider.session() as session:
+            result = await session.rpc(method, *params)
     except RPCError as exc:
-        return HTTPStatus.BAD_REQUEST, {"jsonrpc": "2.0", "error": unstructure(exc)}
+        return HTTPStatus.BAD_REQUEST, {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": unstructure(exc),
+        }
 
     return HTTPStatus.OK, {"jsonrpc": "2.0", "id": request_id, "result": result}
 
 
+async def process_batch_request(
+    provider: Provider, requests: list[JSON]
+) -> tuple[HTTPStatus, JSON]:
+    """
+    Processes every request in a batch separately and collects the responses.
+    The failed requests do not affect the HTTP status of the whole batch.
+    """
+    # JSON RPC 2.0 requires an empty batch to be answered with a single error object.
+    if not requests:
+        error = RPCError.with_code(RPCErrorCode.INVALID_REQUEST, "The batch request is empty")
+        return HTTPStatus.BAD_REQUEST, {"jsonrpc": "2.0", "id": None, "error": unstructure(error)}
+
+    responses = []
+    for request in requests:
+        _status, response = await process_request(provider, request)
+        responses.append(response)
+    return HTTPStatus.OK, responses
+
+
 async def entry_point(request: Request) -> Response:
     data = await request.json()
     provider = request.app.state.provider
     try:
-        status, response = await process_request(provider, data)
+        if isinstance(data, list):
+            status, response = await process_batch_request(provider, data)
+        else:
+            status, response = await process_request(provider, data)
     except Exception as exc:  # noqa: BLE001
         # A catch-all for any unexpected errors
         return Response(str(exc), status_code=HTTPStatus.INTERNAL_SERVER_ERROR)
@@ -61,8 +61,12 @@ class LocalProvider(Provider):
         return SnapshotID(snapshot_id)
 
     def revert_to_snapshot(self, snapshot_id: SnapshotID) -> None:
-        """Restores the chain state to the snapshot with the given ID."""
-        self._local_node = self._snapshots[snapshot_id.id_]
+        """
+        Restores the chain state to the snapshot with the given ID.
+        The snapshot is consumed and cannot be reverted to again.
+        """
+        # The stored state becomes the live one, so it must not be kept as a snapshot.
+        self._local_node = self._snapshots.pop(snapshot_id.id_)
         self._rpc_node = RPCNode(self._local_node)
 
     def rpc(self, method: str, *args: Any) -> JSON:
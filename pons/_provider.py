@@ -1,5 +1,6 @@
+import json
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator, Mapping
+from collections.abc import AsyncIterator, Callable, Mapping, Sequence
 from contextlib import asynccontextmanager
 from http import HTTPStatus
 from json import JSONDecodeError
@@ -10,6 +11,29 @@ from compages import StructuringError
 from ethereum_rpc import JSON, RPCError, structure
 
 
+def _stdlib_json_dumps(obj: JSON) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _stdlib_json_loads(data: bytes) -> JSON:
+    return cast(JSON, json.loads(data))
+
+
+def _select_json_codec() -> tuple[Callable[[JSON], bytes], Callable[[bytes], JSON]]:
+    """
+    Returns the JSON serializer and deserializer,
+    preferring the faster ``orjson`` if it is installed.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return _stdlib_json_dumps, _stdlib_json_loads
+    return orjson.dumps, orjson.loads
+
+
+_json_dumps, _json_loads = _select_json_codec()
+
+
 class InvalidResponse(Exception):
     """Raised when the remote server's response is not of an expected format."""
 
@@ -89,44 +113,124 @@ class ProviderSession(ABC):
             raise ValueError(f"Unexpected provider path: {path}")
         return await self.rpc(method, *args)
 
+    async def rpc_batch(self, calls: Sequence[tuple[str, Sequence[JSON]]]) -> list[JSON | RPCError]:
+        """
+        Calls several RPC methods given as pairs of the method name and the already json-ified
+        arguments. Returns a list of results, where the calls that failed on the backend side
+        are represented by the corresponding :py:class:`RPCError` objects.
+
+        The default implementation makes the calls one by one;
+        it will be typically overriden by the providers supporting batch requests.
+        """
+        results: list[JSON | RPCError] = []
+        for method, args in calls:
+            # PERF203: the overhead is negligible compared to the RPC call itself.
+            try:
+                results.append(await self.rpc(method, *args))
+            except RPCError as exc:  # noqa: PERF203
+                results.append(exc)
+        return results
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class HTTPProvider(Provider):
-    """A provider for RPC via HTTP(S)."""
+    """
+    A provider for RPC via HTTP(S).
+
+    Batch requests are sent in chunks of at most ``max_batch_size`` calls
+    (or all at once, if it is ``None``), since some nodes limit or serialize large batches.
+    """
 
-    def __init__(self, url: str):
+    def __init__(self, url: str, max_batch_size: None | int = None):
+        if max_batch_size is not None and max_batch_size < 1:
+            raise ValueError("The maximum batch size must be positive")
         self._url = url
+        self._max_batch_size = max_batch_size
 
     @asynccontextmanager
     async def session(self) -> AsyncIterator["HTTPSession"]:
         async with httpx.AsyncClient() as client:
-            yield HTTPSession(self._url, client)
+            yield HTTPSession(self._url, client, self._max_batch_size)
 
 
 class HTTPSession(ProviderSession):
-    def __init__(self, url: str, http_client: httpx.AsyncClient):
+    def __init__(self, url: str, http_client: httpx.AsyncClient, max_batch_size: None | int = None):
         self._url = url
         self._client = http_client
+        self._max_batch_size = max_batch_size
 
-    def _prepare_request(self, method: str, *args: JSON) -> JSON:
-        return {"jsonrpc": "2.0", "method": method, "params": args, "id": 0}
+    def _prepare_request(self, method: str, *args: JSON, request_id: int = 0) -> JSON:
+        return {"jsonrpc": "2.0", "method": method, "params": args, "id": request_id}
 
-    async def rpc(self, method: str, *args: JSON) -> JSON:
-        json = self._prepare_request(method, *args)
+    async def _post(self, json: JSON) -> tuple[httpx.Response, JSON]:
         try:
-            response = await self._client.post(self._url, json=json)
+            response = await self._client.post(
+                self._url, content=_json_dumps(json), headers=_JSON_HEADERS
+            )
         except httpx.ConnectError as exc:
             raise Unreachable(str(exc)) from exc
 
-        status = response.status_code
-
         try:
-            response_json = response.json()
+            response_json = _json_loads(response.content)
         except JSONDecodeError as exc:
             content = response.content.decode()
             raise InvalidResponse(
-                f"Expected a JSON response, got HTTP status {status}: {content}"
+                f"Expected a JSON response, got HTTP status {response.status_code}: {content}"
             ) from exc
 
+        return response, response_json
+
+    async def rpc(self, method: str, *args: JSON) -> JSON:
+        json = self._prepare_request(method, *args)
+        response, response_json = await self._post(json)
+        return self._parse_response(response, response_json)
+
+    async def rpc_batch(self, calls: Sequence[tuple[str, Sequence[JSON]]]) -> list[JSON | RPCError]:
+        batch_size = self._max_batch_size or max(len(calls), 1)
+        results: list[JSON | RPCError] = []
+        for start in range(0, len(calls), batch_size):
+            results.extend(await self._rpc_batch(calls[start : start + batch_size]))
+        return results
+
+    async def _rpc_batch(
+        self, calls: Sequence[tuple[str, Sequence[JSON]]]
+    ) -> list[JSON | RPCError]:
+        json = [
+            self._prepare_request(method, *args, request_id=request_id)
+            for request_id, (method, args) in enumerate(calls)
+        ]
+        response, response_json = await self._post(json)
+
+        # If the whole batch was rejected, the server responds with a single error object.
+        if not isinstance(response_json, list):
+            self._parse_response(response, response_json)
+            raise InvalidResponse(f"Batch RPC response must be a list, got: {response_json}")
+
+        # The responses in a batch can come in any order, so they have to be matched by ID.
+        responses = {}
+        for entry in response_json:
+            if not isinstance(entry, Mapping) or "id" not in entry:
+                raise InvalidResponse(f"Batch RPC response entry must have an ID, got: {entry}")
+            responses[entry["id"]] = entry
+
+        results: list[JSON | RPCError] = []
+        for request_id in range(len(calls)):
+            if request_id not in responses:
+                raise InvalidResponse(
+                    f"Request ID {request_id} is not present in the batch response"
+                )
+            try:
+                # Batch responses have the status 200 even if some entries are errors
+                results.append(self._parse_response(response, responses[request_id]))
+            except RPCError as exc:
+                results.append(exc)
+        return results
+
+    def _parse_response(self, response: httpx.Response, response_json: JSON) -> JSON:
+        status = response.status_code
+
         if not isinstance(response_json, Mapping):
             raise InvalidResponse(f"RPC response must be a dictionary, got: {response_json}")
         response_json = cast(Mapping[str, JSON], response_json)
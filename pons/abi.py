@@ -3,24 +3,68 @@
 
 """Aliases for various Solidity types."""
 
-from ._abi_types import AddressType, Bool, Bytes, Int, String, Struct, Type, UInt
+from functools import cache
+from typing import overload
+
+from ._abi_types import (
+    _DYNAMIC_BYTES,
+    AddressType,
+    Bool,
+    Bytes,
+    Int,
+    SizedBytes,
+    String,
+    Struct,
+    Type,
+    UInt,
+)
 
 _PyInt = int
 
 
+# The types are immutable, so the sized ones can be shared between calls.
+# Invalid sizes raise in the constructor, and exceptions are not cached.
+# The caching is done in private helpers, since `cache` erases the signature of the function.
+
+
+@cache
+def _make_uint(bits: _PyInt) -> UInt:
+    return UInt(bits)
+
+
+@cache
+def _make_int(bits: _PyInt) -> Int:
+    return Int(bits)
+
+
+@cache
+def _make_bytes(size: _PyInt) -> SizedBytes:
+    return SizedBytes(size)
+
+
 def uint(bits: _PyInt) -> UInt:
     """Returns the ``uint<bits>`` type."""
-    return UInt(bits)
+    return _make_uint(bits)
 
 
 def int(bits: _PyInt) -> Int:
     """Returns the ``int<bits>`` type."""
-    return Int(bits)
+    return _make_int(bits)
+
+
+@overload
+def bytes(size: None = None) -> Bytes: ...
+
+
+@overload
+def bytes(size: _PyInt) -> SizedBytes: ...
 
 
-def bytes(size: None | _PyInt = None) -> Bytes:
+def bytes(size: None | _PyInt = None) -> Bytes | SizedBytes:
     """Returns the ``bytes<size>`` type, or ``bytes`` if ``size`` is ``None``."""
-    return Bytes(size)
+    if size is None:
+        return _DYNAMIC_BYTES
+    return _make_bytes(size)
 
 
 def struct(**kwargs: Type) -> Struct:
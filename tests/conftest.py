@@ -1,3 +1,5 @@
+import os
+
 import pytest
 from alysis import EVMVersion
 from ethereum_rpc import Amount
@@ -5,11 +7,19 @@ from ethereum_rpc import Amount
 from pons import AccountSigner, Client, LocalProvider
 
 
-@pytest.fixture
-def local_provider():
+@pytest.fixture(scope="session")
+def session_local_provider():
     return LocalProvider(root_balance=Amount.ether(100), evm_version=EVMVersion.CANCUN)
 
 
+@pytest.fixture
+def local_provider(session_local_provider):
+    # Reverting to a snapshot is cheaper than creating a new provider for each test.
+    snapshot_id = session_local_provider.take_snapshot()
+    yield session_local_provider
+    session_local_provider.revert_to_snapshot(snapshot_id)
+
+
 @pytest.fixture
 async def session(local_provider):
     client = Client(provider=local_provider)
@@ -22,6 +32,16 @@ def root_signer(local_provider):
     return local_provider.root
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def another_signer():
+    # Creating a key is relatively slow, and the chain state is reverted after each test anyway,
+    # so the account can be shared.
     return AccountSigner.create()
+
+
+@pytest.fixture(scope="session")
+def server_port():
+    # Each `pytest-xdist` worker needs its own port for the test HTTP server.
+    # Only even ports are used, since `test_provider.py` relies on 8889 being unoccupied.
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    return 8888 + 2 * int(worker_id.removeprefix("gw"))
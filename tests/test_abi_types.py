@@ -1,6 +1,7 @@
 import os
 
 import pytest
+from eth_abi.exceptions import DecodingError
 from ethereum_rpc import Address, keccak
 
 from pons import abi
@@ -21,6 +22,7 @@ def test_uint():
 
     assert abi.uint(256).canonical_form == "uint256"
     assert abi.uint(8) == abi.uint(8)
+    assert abi.uint(8) is abi.uint(8)
     assert abi.uint(8) != abi.uint(16)
 
     for bit_size in [-1, 0, 255, 512]:
@@ -49,6 +51,7 @@ def test_int():
 
     assert abi.int(256).canonical_form == "int256"
     assert abi.int(8) == abi.int(8)
+    assert abi.int(8) is abi.int(8)
     assert abi.int(8) != abi.int(16)
 
     for bit_size in [-1, 0, 255, 512]:
@@ -81,7 +84,10 @@ def test_bytes():
     assert abi.bytes(3).canonical_form == "bytes3"
     assert abi.bytes().canonical_form == "bytes"
     assert abi.bytes(8) == abi.bytes(8)
+    assert abi.bytes(8) is abi.bytes(8)
     assert abi.bytes(8) != abi.bytes(16)
+    assert abi.bytes() == abi.bytes()
+    assert abi.bytes() != abi.bytes(8)
 
     for size in [-1, 0, 33]:
         with pytest.raises(ValueError, match=f"Incorrect `bytes` size: {size}"):
@@ -91,6 +97,8 @@ def test_bytes():
         abi.bytes()._normalize("foo")
     with pytest.raises(ValueError, match="Expected 4 bytes, got 3"):
         abi.bytes(4)._normalize(b"foo")
+    with pytest.raises(TypeError, match="`bytes4` must correspond to a bytestring, got str"):
+        abi.bytes(4)._normalize("foo")
 
 
 def test_address():
@@ -134,6 +142,8 @@ def test_bool():
 
 
 def test_array():
+    assert abi.uint(8)[2] is abi.uint(8)[2]
+    assert abi.uint(8)[...] is abi.uint(8)[...]
     assert abi.uint(8)[2]._normalize([1, 2]) == [1, 2]
     assert abi.uint(8)[2]._denormalize([1, 2]) == [1, 2]
     assert abi.uint(8)[...]._normalize([1, 2, 3]) == [1, 2, 3]
@@ -142,6 +152,7 @@ def test_array():
     assert abi.uint(8)[2].canonical_form == "uint8[2]"
     assert abi.uint(8)[...].canonical_form == "uint8[]"
     assert abi.uint(8)[2] == abi.uint(8)[2]
+    assert hash(abi.uint(8)[2]) == hash(abi.uint(8)[2])
     assert abi.uint(8)[...] == abi.uint(8)[...]
     assert abi.uint(8)[...] != abi.uint(8)[2]
 
@@ -165,6 +176,7 @@ def test_struct():
     assert s1.canonical_form == "(uint8,bool)"
     assert str(s1) == "(uint8 a, bool b)"
     assert s1 == s1_copy
+    assert hash(s1) == hash(s1_copy)
     assert s1 != s2
 
     with pytest.raises(TypeError, match="Expected an iterable, got int"):
@@ -182,9 +194,12 @@ def test_type_from_abi_string():
     assert type_from_abi_string("address") == abi.address
     assert type_from_abi_string("string") == abi.string
     assert type_from_abi_string("bool") == abi.bool
+    assert type_from_abi_string("uint32") is type_from_abi_string("uint32")
 
     with pytest.raises(ValueError, match="Unknown type: uintx"):
         type_from_abi_string("uintx")
+    with pytest.raises(ValueError, match="Unknown type: uint8x"):
+        type_from_abi_string("uint8x")
 
 
 def test_dispatch_type():
@@ -204,6 +219,10 @@ def test_dispatch_type():
         dispatch_type(dict(type="uint8(2)"))
     with pytest.raises(ValueError, match=r"Incorrect type format: uint8\(2\)"):
         dispatch_type(dict(type="uint8(2)[3]"))
+    with pytest.raises(ValueError, match=r"Incorrect type format: uint8\[x\]"):
+        dispatch_type(dict(type="uint8[x]"))
+    with pytest.raises(ValueError, match=r"Incorrect type format: uint8\]"):
+        dispatch_type(dict(type="uint8]"))
 
 
 def test_dispatch_types():
@@ -226,6 +245,11 @@ def test_dispatch_types():
         abi.uint(16)[2],
     ]
 
+    # The entries are only iterated over once, so any iterable works
+    assert dispatch_types(entry for entry in entries) == dict(
+        param2=abi.uint(8), param1=abi.uint(16)[2]
+    )
+
     # For an empty argument list we choose to resolve it as an empty dictionary, for certainty.
     assert dispatch_types([]) == {}
 
@@ -300,6 +324,10 @@ def test_encode_to_topic():
     big_bytes = os.urandom(33)
     check_topic_encode_decode(abi.bytes(), big_bytes, keccak(big_bytes), can_be_decoded=False)
 
+    # An invalid word is passed to `eth_abi` to report the exact problem (non-zero padding here)
+    with pytest.raises(DecodingError, match="Padding bytes were not empty"):
+        abi.bytes(5).decode_from_topic(b"\x01" * 32)
+
     string = "\u1234abcd"  # using Unicode here to check that encoding is happening
     check_topic_encode_decode(abi.string, string, keccak(string.encode()), can_be_decoded=False)
 
@@ -341,6 +369,23 @@ def test_encode_decode_args():
     encoded = encode_args(*zip(types, args, strict=True))
     assert decode_args(types, encoded) == args
 
+    # static value types only (encoded as a simple concatenation of words)
+    addr = Address(os.urandom(20))
+    args = (-1, True, addr, b"foo", 1234)
+    types = [abi.int(8), abi.bool, abi.address, abi.bytes(3), abi.uint(256)]
+    encoded = encode_args(*zip(types, args, strict=True))
+    assert encoded == (
+        b"\xff" * 32
+        + b"\x00" * 31
+        + b"\x01"
+        + b"\x00" * 12
+        + bytes(addr)
+        + b"foo"
+        + b"\x00" * 29
+        + (1234).to_bytes(32, "big")
+    )
+    assert decode_args(types, encoded) == args
+
     # empty types/args list
     assert encode_args() == b""
 
@@ -356,3 +401,15 @@ def test_decoding_error():
 
     with pytest.raises(ABIDecodingError, match=expected_message):
         decode_args(types, encoded_bytes)
+
+    # Values not fitting into the type are reported as well
+    types = [abi.uint(256), abi.uint(8)]
+    encoded_bytes = b"\x00" * 31 + b"\x01" + b"\x00" * 30 + b"\x01\x01"
+
+    expected_message = (
+        r"Could not decode the return value with the expected signature \(uint256,uint8\): "
+        r"Padding bytes were not empty"
+    )
+
+    with pytest.raises(ABIDecodingError, match=expected_message):
+        decode_args(types, encoded_bytes)
@@ -1,6 +1,6 @@
-import os
-from contextlib import contextmanager
 from pathlib import Path
+from random import Random
+from unittest.mock import patch
 
 import pytest
 import trio
@@ -35,21 +35,19 @@ from pons._abi_types import encode_args
 from pons._client import BadResponseFormat, ProviderError, TransactionFailed
 from pons._contract_abi import PANIC_ERROR
 
+# Seeded, so that the failures involving these values are reproducible
+RNG = Random(123)  # noqa: S311
+RANDOM_ADDRESS = Address(RNG.randbytes(20))
+RANDOM_TX_HASH = TxHash(RNG.randbytes(32))
+RANDOM_KEY = Address(RNG.randbytes(20))
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def compiled_contracts():
     path = Path(__file__).resolve().parent / "TestClient.sol"
     return compile_contract_file(path)
 
 
-@contextmanager
-def monkeypatched(obj, attr, patch):
-    original_value = getattr(obj, attr)
-    setattr(obj, attr, patch)
-    yield obj
-    setattr(obj, attr, original_value)
-
-
 def normalize_topics(topics):
     """
     Reduces visual noise in assertions by bringing the log topics in a log entry
@@ -68,14 +66,14 @@ async def test_net_version(local_provider, session):
         raise NotImplementedError  # pragma: no cover
 
     # The result should have been cached the first time
-    with monkeypatched(local_provider, "rpc", mock_rpc):
+    with patch.object(local_provider, "rpc", mock_rpc):
         net_version2 = await session.net_version()
     assert net_version1 == net_version2
 
 
 async def test_net_version_type_check(local_provider, session):
     # Provider returning a bad value
-    with monkeypatched(local_provider, "rpc", lambda *_args: 0):
+    with patch.object(local_provider, "rpc", lambda *_args: 0):
         with pytest.raises(BadResponseFormat, match="net_version: The value must be a string"):
             await session.net_version()
 
@@ -93,10 +91,16 @@ async def test_eth_chain_id():
         assert chain_id1 == 123
 
         # The result should have been cached the first time
-        with monkeypatched(local_provider, "rpc", mock_rpc):
+        with patch.object(local_provider, "rpc", mock_rpc):
             chain_id2 = await session.eth_chain_id()
         assert chain_id1 == chain_id2
 
+    # The cached value is shared with the subsequent sessions of the same client
+    async with client.session() as session:
+        with patch.object(local_provider, "rpc", mock_rpc):
+            chain_id3 = await session.eth_chain_id()
+        assert chain_id1 == chain_id3
+
 
 async def test_eth_get_balance(session, root_signer, another_signer):
     to_transfer = Amount.ether(10)
@@ -105,8 +109,7 @@ async def test_eth_get_balance(session, root_signer, another_signer):
     assert acc1_balance == to_transfer
 
     # Non-existent address (which is technically just an unfunded address)
-    random_addr = Address(os.urandom(20))
-    balance = await session.eth_get_balance(random_addr)
+    balance = await session.eth_get_balance(RANDOM_ADDRESS)
     assert balance == Amount.ether(0)
 
 
@@ -123,7 +126,7 @@ async def test_eth_get_transaction_receipt(local_provider, session, root_signer,
     assert receipt.succeeded
 
     # A non-existent transaction
-    receipt = await session.eth_get_transaction_receipt(TxHash(os.urandom(32)))
+    receipt = await session.eth_get_transaction_receipt(RANDOM_TX_HASH)
     assert receipt is None
 
 
@@ -150,7 +153,7 @@ async def test_wait_for_transaction_receipt(
     tx_hash = await session.broadcast_transfer(root_signer, another_signer.address, to_transfer)
 
     # The receipt won't be available until we mine, so the waiting should time out
-    timeout = 5
+    timeout = 1
     start_time = trio.current_time()
     with pytest.raises(trio.TooSlowError):
         with trio.fail_after(timeout):
@@ -176,12 +179,57 @@ async def test_wait_for_transaction_receipt(
     assert receipt.succeeded
 
 
+async def test_wait_for_transaction_receipt_backoff(
+    autojump_clock,  # noqa: ARG001
+    local_provider,
+    session,
+    root_signer,
+    another_signer,
+):
+    local_provider.disable_auto_mine_transactions()
+    tx_hash = await session.broadcast_transfer(
+        root_signer, another_signer.address, Amount.ether(10)
+    )
+
+    orig_get_transaction_receipt = session.eth_get_transaction_receipt
+    requests = 0
+
+    async def counting_get_transaction_receipt(tx_hash):
+        nonlocal requests
+        requests += 1
+        return await orig_get_transaction_receipt(tx_hash)
+
+    with patch.object(session, "eth_get_transaction_receipt", counting_get_transaction_receipt):
+        with pytest.raises(trio.TooSlowError):
+            with trio.fail_after(20):
+                await session.wait_for_transaction_receipt(tx_hash)
+
+    # The requests are made at 0, 1, 2.5, 4.75, 8.125, 13.125, and 18.125 seconds
+    # (as opposed to 20 requests with a constant latency).
+    assert requests == 7
+
+    # A polling latency greater than the default maximum one is kept as is.
+    requests = 0
+    with patch.object(session, "eth_get_transaction_receipt", counting_get_transaction_receipt):
+        with pytest.raises(trio.TooSlowError):
+            with trio.fail_after(35):
+                await session.wait_for_transaction_receipt(tx_hash, poll_latency=10)
+
+    # The requests are made at 0, 10, 20, and 30 seconds
+    assert requests == 4
+
+
 async def test_eth_call(session, compiled_contracts, root_signer, another_signer):
     compiled_contract = compiled_contracts["BasicContract"]
     deployed_contract = await session.deploy(root_signer, compiled_contract.constructor(123))
     result = await session.eth_call(deployed_contract.method.getState(456))
     assert result == (123 + 456,)
 
+    results = await session.eth_call_batch(
+        [deployed_contract.method.getState(456), deployed_contract.method.getState(789)]
+    )
+    assert results == [(123 + 456,), (123 + 789,)]
+
     # With a real provider, if `sender_address` is not given, it will default to the zero address.
     result = await session.eth_call(deployed_contract.method.getSender())
     assert result == (Address(b"\x00" * 20),)
@@ -220,26 +268,41 @@ async def test_eth_call_decoding_error(session, compiled_contracts, root_signer)
     compiled_contract = compiled_contracts["BasicContract"]
     deployed_contract = await session.deploy(root_signer, compiled_contract.constructor(123))
 
-    wrong_abi = ContractABI(
-        methods=[
-            Method(
-                name="getState",
-                mutability=Mutability.VIEW,
-                inputs=[abi.uint(256)],
-                # the actual method in in BasicContract returns only one uint256
-                outputs=[abi.uint(256), abi.uint(256)],
-            )
-        ]
-    )
-    wrong_contract = DeployedContract(abi=wrong_abi, address=deployed_contract.address)
+    # The actual method in BasicContract returns only one uint256
+    cases = [
+        (
+            [abi.uint(256), abi.uint(256)],
+            r"Could not decode the return value with the expected signature \(uint256,uint256\): "
+            r"Tried to read 32 bytes, only got 0 bytes",
+        ),
+        (
+            [abi.bool],
+            r"Could not decode the return value with the expected signature \(bool\): "
+            r"Boolean must be either 0x0 or 0x1",
+        ),
+        (
+            [abi.string],
+            r"Could not decode the return value with the expected signature \(string\): "
+            r"Invalid pointer in tuple at location 0 in payload",
+        ),
+    ]
 
-    expected_message = (
-        r"Could not decode the return value with the expected signature \(uint256,uint256\): "
-        r"Tried to read 32 bytes, only got 0 bytes"
-    )
+    # Reusing the same deployed contract for all the mismatched signatures
+    for outputs, expected_message in cases:
+        wrong_abi = ContractABI(
+            methods=[
+                Method(
+                    name="getState",
+                    mutability=Mutability.VIEW,
+                    inputs=[abi.uint(256)],
+                    outputs=outputs,
+                )
+            ]
+        )
+        wrong_contract = DeployedContract(abi=wrong_abi, address=deployed_contract.address)
 
-    with pytest.raises(ABIDecodingError, match=expected_message):
-        await session.eth_call(wrong_contract.method.getState(456))
+        with pytest.raises(ABIDecodingError, match=expected_message):
+            await session.eth_call(wrong_contract.method.getState(456))
 
 
 async def test_estimate_deploy(session, compiled_contracts, root_signer):
@@ -282,11 +345,12 @@ async def test_eth_gas_price(session):
 
 async def test_eth_block_number(session, root_signer, another_signer):
     await session.transfer(root_signer, another_signer.address, Amount.ether(1))
-    await session.transfer(root_signer, another_signer.address, Amount.ether(2))
+    receipt = await session.transfer(root_signer, another_signer.address, Amount.ether(2))
     await session.transfer(root_signer, another_signer.address, Amount.ether(3))
     block_num = await session.eth_block_number()
+    assert block_num == receipt.block_number + 1
 
-    block_info = await session.eth_get_block_by_number(block_num - 1, with_transactions=True)
+    block_info = await session.eth_get_block_by_number(receipt.block_number, with_transactions=True)
     assert block_info.transactions[0].value == Amount.ether(2)
 
 
@@ -295,12 +359,105 @@ async def test_transfer(session, root_signer, another_signer):
     root_balance = await session.eth_get_balance(root_signer.address)
     to_transfer = Amount.ether(10)
     await session.transfer(root_signer, another_signer.address, to_transfer)
-    root_balance_after = await session.eth_get_balance(root_signer.address)
-    acc1_balance_after = await session.eth_get_balance(another_signer.address)
+    root_balance_after, acc1_balance_after = await session.eth_get_balance_batch(
+        [root_signer.address, another_signer.address]
+    )
     assert acc1_balance_after == to_transfer
     assert root_balance - root_balance_after > to_transfer
 
 
+async def test_eth_get_balance_batch_error(local_provider, session, root_signer):
+    orig_rpc = local_provider.rpc
+
+    def mock_rpc(method, *args):
+        if method == "eth_getBalance" and args[0] == RANDOM_ADDRESS.checksum:
+            raise RPCError(666, "this address is possessed")
+        return orig_rpc(method, *args)
+
+    with patch.object(local_provider, "rpc", mock_rpc):
+        with pytest.raises(
+            ProviderError, match=r"Provider error \(666\): this address is possessed"
+        ):
+            await session.eth_get_balance_batch([root_signer.address, RANDOM_ADDRESS])
+
+
+async def test_read_cache(local_provider, session, root_signer, another_signer):
+    orig_rpc = local_provider.rpc
+    methods = []
+
+    def counting_rpc(method, *args):
+        methods.append(method)
+        return orig_rpc(method, *args)
+
+    with patch.object(local_provider, "rpc", counting_rpc):
+        with session.read_cache():
+            balance = await session.eth_get_balance(root_signer.address)
+            assert await session.eth_get_balance(root_signer.address) == balance
+            assert methods.count("eth_getBalance") == 1
+
+            # Sending a transaction invalidates the cache
+            await session.transfer(root_signer, another_signer.address, Amount.ether(10))
+            assert await session.eth_get_balance(root_signer.address) < balance
+            assert methods.count("eth_getBalance") == 2
+
+        # Outside of the context the calls are not cached
+        await session.eth_get_balance(root_signer.address)
+        await session.eth_get_balance(root_signer.address)
+        assert methods.count("eth_getBalance") == 4
+
+
+async def test_read_cache_new_block(local_provider, session, root_signer, another_signer):
+    other_client = Client(local_provider)
+
+    with session.read_cache():
+        await session.eth_block_number()
+        balance = await session.eth_get_balance(another_signer.address)
+
+        # A transaction sent by someone else is not observed...
+        async with other_client.session() as other_session:
+            await other_session.transfer(root_signer, another_signer.address, Amount.ether(10))
+        assert await session.eth_get_balance(another_signer.address) == balance
+
+        # ...until a new block number is seen.
+        await session.eth_block_number()
+        assert await session.eth_get_balance(another_signer.address) == balance + Amount.ether(10)
+
+
+async def test_read_cache_concurrent_tasks(
+    autojump_clock,  # noqa: ARG001
+    session,
+    root_signer,
+    another_signer,
+):
+    provider_session = session._provider_session
+    orig_rpc = provider_session.rpc
+
+    async def slow_rpc(method, *args):
+        # The result is obtained right away, but returned with a delay,
+        # so that other tasks can modify the state in the meantime.
+        result = await orig_rpc(method, *args)
+        if method == "eth_getBalance":
+            await trio.sleep(10)
+        return result
+
+    with patch.object(provider_session, "rpc", slow_rpc):
+        # Leaving the cache context while a call is in flight
+        async with trio.open_nursery() as nursery:
+            with session.read_cache():
+                nursery.start_soon(session.eth_get_balance, root_signer.address)
+                await trio.sleep(1)
+
+        # Invalidating the cache while a call is in flight
+        with session.read_cache():
+            async with trio.open_nursery() as nursery:
+                nursery.start_soon(session.eth_get_balance, another_signer.address)
+                await trio.sleep(1)
+                await session.transfer(root_signer, another_signer.address, Amount.ether(10))
+
+            # The stale balance requested before the transfer must not have been cached
+            assert await session.eth_get_balance(another_signer.address) == Amount.ether(10)
+
+
 async def test_transfer_custom_gas(session, root_signer, another_signer):
     root_balance = await session.eth_get_balance(root_signer.address)
     to_transfer = Amount.ether(10)
@@ -308,8 +465,9 @@ async def test_transfer_custom_gas(session, root_signer, another_signer):
     # Override gas estimate
     # The standard transfer gas cost is 21000, we're being cautious here.
     await session.transfer(root_signer, another_signer.address, to_transfer, gas=22000)
-    root_balance_after = await session.eth_get_balance(root_signer.address)
-    acc1_balance_after = await session.eth_get_balance(another_signer.address)
+    root_balance_after, acc1_balance_after = await session.eth_get_balance_batch(
+        [root_signer.address, another_signer.address]
+    )
     assert acc1_balance_after == to_transfer
     assert root_balance - root_balance_after > to_transfer
 
@@ -330,7 +488,7 @@ async def test_transfer_failed(local_provider, session, root_signer, another_sig
             result["status"] = "0x0"
         return result
 
-    with monkeypatched(local_provider, "rpc", mock_rpc):
+    with patch.object(local_provider, "rpc", mock_rpc):
         with pytest.raises(TransactionFailed, match="Transfer failed"):
             await session.transfer(root_signer, another_signer.address, Amount.ether(10))
 
@@ -372,7 +530,7 @@ async def test_deploy(local_provider, session, compiled_contracts, root_signer):
             result["contractAddress"] = None
         return result
 
-    with monkeypatched(local_provider, "rpc", mock_rpc):
+    with patch.object(local_provider, "rpc", mock_rpc):
         with pytest.raises(
             BadResponseFormat,
             match=(
@@ -573,7 +731,7 @@ async def test_eth_get_code(session, root_signer, compiled_contracts):
 
 async def test_eth_get_storage_at(session, root_signer, compiled_contracts):
     x = 0xAB
-    y_key = Address(os.urandom(20))
+    y_key = RANDOM_KEY
     y_val = 0xCD
 
     compiled_contract = compiled_contracts["Storage"]
@@ -1124,7 +1282,7 @@ async def test_unknown_error_reasons(local_provider, session, compiled_contracts
             raise RPCError(RPCErrorCode.EXECUTION_ERROR, "execution reverted", data)
         return orig_rpc(method, *args)
 
-    with monkeypatched(local_provider, "rpc", mock_rpc):
+    with patch.object(local_provider, "rpc", mock_rpc):
         with pytest.raises(ContractPanic, match=r"ContractPanicReason.UNKNOWN"):
             await session.estimate_transact(root_signer.address, contract.method.transactPanic(999))
 
@@ -1137,7 +1295,7 @@ async def test_unknown_error_reasons(local_provider, session, compiled_contracts
             raise RPCError(RPCErrorCode.EXECUTION_ERROR, "execution reverted", data)
         return orig_rpc(method, *args)
 
-    with monkeypatched(local_provider, "rpc", mock_rpc):
+    with patch.object(local_provider, "rpc", mock_rpc):
         with pytest.raises(
             ProviderError,
             match=r"Provider error \(RPCErrorCode\.EXECUTION_ERROR\): execution reverted",
@@ -1153,6 +1311,6 @@ async def test_unknown_error_reasons(local_provider, session, compiled_contracts
             raise RPCError(12345, "execution reverted", data)
         return orig_rpc(method, *args)
 
-    with monkeypatched(local_provider, "rpc", mock_rpc):
+    with patch.object(local_provider, "rpc", mock_rpc):
         with pytest.raises(ProviderError, match=r"Provider error \(12345\): execution reverted"):
             await session.estimate_transact(root_signer.address, contract.method.transactPanic(999))
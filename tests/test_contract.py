@@ -17,7 +17,7 @@ from pons._abi_types import encode_args
 from pons._contract import BoundMethod, DeployedContract
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def compiled_contracts():
     path = Path(__file__).resolve().parent / "TestContract.sol"
     return compile_contract_file(path)
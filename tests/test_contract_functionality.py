@@ -15,7 +15,7 @@ from pons import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def compiled_contracts():
     path = Path(__file__).resolve().parent / "TestContractFunctionality.sol"
     return compile_contract_file(path, evm_version=EVMVersion.CANCUN)
@@ -149,6 +149,37 @@ async def test_raising_errors():
             await session.rpc(random_request())
 
 
+async def test_batch_request():
+    strategy = PriorityFallback()
+    providers = [MockProvider() for i in range(3)]
+    provider = FallbackProvider(providers, strategy)
+
+    requests = [random_request() for _ in range(3)]
+    calls = [(request, ()) for request in requests]
+
+    async with provider.session() as session:
+        # The whole batch is sent to the first provider
+        assert await session.rpc_batch(calls) == ["success"] * 3
+        assert providers[0].requests == requests
+
+        # 0 is unreachable, the whole batch is sent to 1
+        providers[0].set_state(ProviderState.UNREACHABLE)
+        assert await session.rpc_batch(calls) == ["success"] * 3
+        assert providers[1].requests == requests
+
+        # Errors in individual calls are returned and do not trigger the fallback
+        providers[1].set_state(ProviderState.RPC_ERROR)
+        results = await session.rpc_batch(calls)
+        assert all(isinstance(result, RPCError) for result in results)
+        assert providers[2].requests == []
+
+        # All are unreachable, an Unreachable is raised
+        providers[1].set_state(ProviderState.UNREACHABLE)
+        providers[2].set_state(ProviderState.UNREACHABLE)
+        with pytest.raises(Unreachable):
+            await session.rpc_batch(calls)
+
+
 async def test_nested_providers():
     providers = [MockProvider() for i in range(4)]
     subprovider1 = FallbackProvider([providers[0], providers[1]], PriorityFallback())
@@ -8,8 +8,8 @@ from pons import HTTPProviderServer
 
 
 @pytest.fixture
-async def server(nursery, local_provider):
-    handle = HTTPProviderServer(local_provider)
+async def server(nursery, local_provider, server_port):
+    handle = HTTPProviderServer(local_provider, port=server_port)
     await nursery.start(handle)
     yield handle
     await handle.shutdown()
@@ -39,3 +39,11 @@ async def test_invalid_parameters(provider_session, monkeypatch):
     with pytest.raises(RPCError) as excinfo:
         await provider_session.rpc("method1", 1, 2, 3)
     assert excinfo.value.code == RPCErrorCode.INVALID_REQUEST.value
+
+
+async def test_empty_batch(provider_session):
+    # The client never sends empty batches, have to use the internals
+    with pytest.raises(RPCError) as excinfo:
+        await provider_session._rpc_batch([])
+    assert excinfo.value.code == RPCErrorCode.INVALID_REQUEST.value
+    assert excinfo.value.message == "The batch request is empty"
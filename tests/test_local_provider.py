@@ -25,8 +25,9 @@ def root_signer(provider):
     return provider.root
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def another_signer():
+    # The providers are created anew for each test, so the account can be shared.
     return AccountSigner.create()
 
 
@@ -76,6 +77,17 @@ async def test_snapshots(provider, session, root_signer, another_signer):
     assert await session.eth_get_balance(dest) == amount
 
 
+async def test_snapshots_are_released(provider, session, root_signer, another_signer):
+    for _ in range(3):
+        snapshot_id = provider.take_snapshot()
+        await session.transfer(root_signer, another_signer.address, Amount.ether(1))
+        provider.revert_to_snapshot(snapshot_id)
+
+    # Reverted snapshots do not accumulate
+    assert provider._snapshots == {}
+    assert await session.eth_get_balance(another_signer.address) == Amount.ether(0)
+
+
 async def test_net_version(session):
     assert await session.net_version() == "1"
 
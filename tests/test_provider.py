@@ -1,9 +1,13 @@
+import json
+import sys
 from contextlib import asynccontextmanager
 from http import HTTPStatus
 
+import httpx
+import orjson
 import pytest
 import trio
-from ethereum_rpc import Amount
+from ethereum_rpc import Amount, RPCError, unstructure
 
 from pons import (
     Client,
@@ -11,19 +15,42 @@ from pons import (
     HTTPProviderServer,
     Unreachable,
     _http_provider_server,  # For monkeypatching purposes
+    _provider,  # For monkeypatching purposes
 )
 from pons._client import BadResponseFormat, ProviderError
-from pons._provider import HTTPError, Provider, ProviderSession
+from pons._provider import (
+    HTTPError,
+    InvalidResponse,
+    Provider,
+    ProviderSession,
+    _select_json_codec,
+    _stdlib_json_dumps,
+    _stdlib_json_loads,
+)
 
 
 @pytest.fixture
-async def test_server(nursery, local_provider):
-    handle = HTTPProviderServer(local_provider)
+async def test_server(nursery, local_provider, server_port):
+    handle = HTTPProviderServer(local_provider, port=server_port)
     await nursery.start(handle)
     yield handle
     await handle.shutdown()
 
 
+@pytest.fixture
+def http_posts(monkeypatch):
+    # Records the JSON payloads of all the HTTP requests sent by `HTTPProvider`.
+    orig_post = httpx.AsyncClient.post
+    posts = []
+
+    async def recording_post(self, *args, **kwargs):
+        posts.append(json.loads(kwargs["content"]))
+        return await orig_post(self, *args, **kwargs)
+
+    monkeypatch.setattr(httpx.AsyncClient, "post", recording_post)
+    return posts
+
+
 @pytest.fixture
 async def session(test_server):
     client = Client(test_server.http_provider)
@@ -176,6 +203,100 @@ async def test_result_is_not_a_dict(session, monkeypatch):
         await session.net_version()
 
 
+async def test_batch_request(test_server, http_posts, root_signer, another_signer):
+    async with test_server.http_provider.session() as session:
+        results = await session.rpc_batch(
+            [
+                ("net_version", ()),
+                ("eth_getBalance", (root_signer.address.checksum, "latest")),
+                ("eth_nonexistentMethod", ()),
+                ("eth_getBalance", (another_signer.address.checksum, "latest")),
+            ]
+        )
+
+    assert len(http_posts) == 1
+    assert results[0] == "1"
+    assert results[1] == unstructure(Amount.ether(100))
+    assert isinstance(results[2], RPCError)
+    assert results[3] == "0x0"
+
+
+async def test_batch_request_chunks(test_server, http_posts):
+    provider = HTTPProvider(test_server.http_provider._url, max_batch_size=2)
+    async with provider.session() as session:
+        assert await session.rpc_batch([]) == []
+        results = await session.rpc_batch([("net_version", ())] * 5)
+
+    assert results == ["1"] * 5
+    assert [len(post) for post in http_posts] == [2, 2, 1]
+
+    with pytest.raises(ValueError, match="The maximum batch size must be positive"):
+        HTTPProvider("http://127.0.0.1:8888", max_batch_size=0)
+
+
+async def test_batch_request_malformed_response(test_server, monkeypatch):
+    async def faulty_process_batch_request(*_args, **_kwargs):
+        return (HTTPStatus.OK, [{"jsonrpc": "2.0", "result": "1"}])
+
+    monkeypatch.setattr(
+        _http_provider_server, "process_batch_request", faulty_process_batch_request
+    )
+
+    async with test_server.http_provider.session() as session:
+        with pytest.raises(InvalidResponse, match="Batch RPC response entry must have an ID"):
+            await session.rpc_batch([("net_version", ())])
+
+    async def faulty_process_batch_request(*_args, **_kwargs):
+        return (HTTPStatus.OK, [])
+
+    monkeypatch.setattr(
+        _http_provider_server, "process_batch_request", faulty_process_batch_request
+    )
+
+    async with test_server.http_provider.session() as session:
+        with pytest.raises(InvalidResponse, match="Request ID 0 is not present"):
+            await session.rpc_batch([("net_version", ())])
+
+    async def faulty_process_batch_request(*_args, **_kwargs):
+        return (HTTPStatus.OK, 1)
+
+    monkeypatch.setattr(
+        _http_provider_server, "process_batch_request", faulty_process_batch_request
+    )
+
+    async with test_server.http_provider.session() as session:
+        with pytest.raises(InvalidResponse, match="RPC response must be a dictionary, got: 1"):
+            await session.rpc_batch([("net_version", ())])
+
+
+def test_json_codec_selection(monkeypatch):
+    assert _select_json_codec() == (orjson.dumps, orjson.loads)
+
+    # Setting the module to `None` makes the import raise `ImportError`
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    assert _select_json_codec() == (_stdlib_json_dumps, _stdlib_json_loads)
+
+
+async def test_stdlib_json_codec(local_provider, test_server, monkeypatch, root_signer):
+    # Check that the fallback codec works end-to-end.
+    monkeypatch.setattr(_provider, "_json_dumps", _stdlib_json_dumps)
+    monkeypatch.setattr(_provider, "_json_loads", _stdlib_json_loads)
+
+    client = Client(test_server.http_provider)
+    async with client.session() as session:
+        assert await session.net_version() == "1"
+        assert await session.eth_get_balance_batch([root_signer.address]) == [Amount.ether(100)]
+
+        def faulty_rpc(_method, *_args):
+            raise Exception("Something unexpected happened")  # noqa: TRY002
+
+        monkeypatch.setattr(local_provider, "rpc", faulty_rpc)
+        with pytest.raises(
+            BadResponseFormat, match="Expected a JSON response, got HTTP status 500"
+        ):
+            await session.eth_block_number()
+
+
 async def test_unreachable_provider():
     bad_provider = HTTPProvider("https://127.0.0.1:8889")
     client = Client(bad_provider)
@@ -207,3 +328,6 @@ async def test_default_implementations():
 
         with pytest.raises(ValueError, match=r"Unexpected provider path: \(1,\)"):
             await session.rpc_at_pin((1,), "3")
+
+        result = await session.rpc_batch([("4", ()), ("5", ())])
+        assert result == ["4", "5"]